@@ -1,9 +1,18 @@
 import streamlit as st
 import requests
-import json
+from urllib3.util import Retry
+import orjson
 import os
-from groq import Groq
-from tavily import TavilyClient
+import re
+import socket
+import asyncio
+import hashlib
+import threading
+import httpx
+from groq import Groq, AsyncGroq
+import diskcache
+from sentence_transformers import SentenceTransformer
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from dotenv import load_dotenv
@@ -18,8 +27,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS for professional styling
-st.markdown("""
+# Custom CSS for professional styling, built once at import time
+_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -68,7 +77,34 @@ st.markdown("""
         font-size: 0.9rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Static HTML templates, rendered with .format() instead of rebuilding
+# multi-line f-strings on every rerun
+SCORE_CARD_TMPL = """
+<div class="score-card {cls}">
+    <h2 style="margin:0;">Budget Window Score</h2>
+    <h1 style="font-size:4rem;margin:0.5rem 0;">{score}</h1>
+    <h3 style="margin:0;">Status: {status}</h3>
+    {confidence}
+</div>
+"""
+
+METRIC_CARD_TMPL = """
+<div class="metric-card">
+    <h4>{label}</h4>
+    <h2>{value}</h2>
+</div>
+"""
+
+# Score status -> card CSS class (see _CSS above)
+_STATUS_CLASS = {
+    'GREEN': 'score-green',
+    'YELLOW': 'score-yellow',
+    'RED': 'score-red'
+}
+
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # Header
 st.markdown('<h1 class="main-header">🎯 Budget Window Predictor</h1>', unsafe_allow_html=True)
@@ -111,112 +147,217 @@ with st.sidebar:
 # Main content
 domain = st.text_input("🌐 Enter Target Domain", placeholder="e.g., stripe.com", help="Company domain to analyze")
 
-def get_fullenrich_data(domain, api_key):
-    """Fetch company and contact data from FullEnrich API"""
-    try:
-        url = "https://app.fullenrich.com/api/v1/company/enrich"
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        payload = {"domain": domain}
-        
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.warning(f"FullEnrich API returned status {response.status_code}")
-            return None
-    except Exception as e:
-        st.error(f"FullEnrich Error: {str(e)}")
-        return None
+FULLENRICH_ENRICH_URL = "https://app.fullenrich.com/api/v1/company/enrich"
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
 
-def get_market_signals(domain, api_key):
-    """Use Tavily to search for market signals"""
-    try:
-        client = TavilyClient(api_key=api_key)
-        
-        signals = {}
-        
-        # Search for funding information
-        funding_query = f"When was {domain} last funding round?"
-        funding_results = client.search(funding_query, max_results=3)
-        signals['funding'] = funding_results
-        
-        # Search for hiring activity
-        hiring_query = f"Is {domain} hiring for sales roles?"
-        hiring_results = client.search(hiring_query, max_results=3)
-        signals['hiring'] = hiring_results
-        
-        # Search for tech stack
-        tech_query = f"What tech stack does {domain} use?"
-        tech_results = client.search(tech_query, max_results=3)
-        signals['tech_stack'] = tech_results
-        
-        return signals
-    except Exception as e:
-        st.error(f"Tavily Error: {str(e)}")
-        return None
+@st.cache_resource
+def http_session():
+    """Shared pooled requests.Session, reused across Streamlit reruns
 
-def analyze_with_groq_advanced(company_data, market_signals, api_key, domain):
+    Streamlit re-executes the whole script on every interaction; without a
+    cached session each analysis pays a fresh DNS lookup + TLS handshake.
     """
-    ADVANCED: Multi-step reasoning with Groq (Llama 3.3)
-    
-    This approach uses:
-    1. Structured data extraction
-    2. Multi-dimensional scoring
-    3. Chain-of-thought reasoning
-    4. Confidence intervals
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['POST'],
+        respect_retry_after_header=True
+    )
+    adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+@st.cache_resource
+def groq_client(api_key):
+    """Groq client cached per API key so its connection pool survives reruns"""
+    return Groq(api_key=api_key)
+
+_WARM_HOSTS = ('https://app.fullenrich.com', 'https://api.tavily.com', 'https://api.groq.com')
+
+def _warm_connections(session):
+    """Open keep-alive connections to the API hosts ahead of the first click
+
+    Moves the DNS + TLS handshake (~100-300ms per host) off the critical
+    path of the first analysis. The session is resolved by the caller on
+    the script thread - st.cache_resource must not run on a bare thread
+    with no ScriptRunContext.
     """
-    try:
-        client = Groq(api_key=api_key)
-        
-        # Step 1: Extract structured insights from market signals
-        extraction_prompt = f"""You are a data extraction specialist. Analyze these market signals and extract ONLY factual data points in JSON format.
-
-MARKET SIGNALS:
-{json.dumps(market_signals, indent=2)}
-
-Return ONLY this JSON structure:
-{{
-    "funding": {{
-        "last_round_date": "<date or null>",
-        "amount": "<amount or null>",
-        "recency_months": <number or null>
-    }},
-    "hiring": {{
-        "active_roles": <number>,
-        "sales_focused": <true/false>,
-        "growth_signal": "<expanding|stable|contracting>"
-    }},
-    "tech_stack": {{
-        "modern_tools": ["tool1", "tool2"],
-        "legacy_systems": ["system1"],
-        "recent_changes": <true/false>
-    }}
-}}"""
-
-        extraction_response = client.chat.completions.create(
-            messages=[
-                {"role": "system", "content": "You are a data extraction expert. Return only valid JSON."},
-                {"role": "user", "content": extraction_prompt}
-            ],
-            model="llama-3.3-70b-versatile",
-            temperature=0.1,
-            max_tokens=1000
+    for url in _WARM_HOSTS:
+        try:
+            session.head(url, timeout=5)
+        except requests.RequestException:
+            pass
+
+if 'warmed' not in st.session_state:
+    threading.Thread(target=_warm_connections, args=(http_session(),), daemon=True).start()
+    st.session_state['warmed'] = True
+
+async def _fullenrich_enrich(domain, api_key):
+    """Fetch company and contact data from the FullEnrich API"""
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
+    return await asyncio.to_thread(
+        http_session().post,
+        FULLENRICH_ENRICH_URL,
+        headers=headers,
+        json={"domain": domain},
+        timeout=30
+    )
+
+# Transient statuses worth retrying, mirroring the status_forcelist on the
+# shared requests.Session
+_TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+async def _tavily_search(query, api_key, session, max_results=8):
+    """Run a single Tavily search against the REST endpoint
+
+    Retries transient statuses with backoff - httpx has no urllib3-style
+    Retry, and Tavily bypasses the retrying requests.Session, so without
+    this loop a single 429 failed the whole pipeline.
+    """
+    for attempt in range(4):
+        response = await session.post(
+            TAVILY_SEARCH_URL,
+            json={"api_key": api_key, "query": query, "max_results": max_results}
         )
-        
-        extracted_data = json.loads(extraction_response.choices[0].message.content.strip())
-        
-        # Step 2: Multi-dimensional scoring
-        scoring_prompt = f"""You are a sales intelligence scoring engine. Calculate scores across 5 dimensions:
+        if response.status_code in _TRANSIENT_STATUSES and attempt < 3:
+            retry_after = response.headers.get('retry-after', '')
+            delay = float(retry_after) if retry_after.isdigit() else 0.3 * (2 ** attempt)
+            await asyncio.sleep(delay)
+            continue
+        response.raise_for_status()
+        return response.json()
 
-COMPANY DATA:
-{json.dumps(company_data, indent=2)}
+# Keywords used to split the combined search results back into per-intent buckets
+_SIGNAL_KEYWORDS = {
+    'funding': ('fund', 'raise', 'series', 'investment', 'valuation'),
+    'hiring': ('hiring', 'careers', 'job', 'recruit'),
+    'tech_stack': ('stack', 'tech', 'platform', 'engineering')
+}
 
-EXTRACTED INSIGHTS:
-{json.dumps(extracted_data, indent=2)}
+def _bucket_signals(search_response):
+    """Split combined Tavily results into the per-intent shape used downstream"""
+    signals = {key: {'results': []} for key in _SIGNAL_KEYWORDS}
+    for result in search_response.get('results', []):
+        text = f"{result.get('title', '')} {result.get('content', '')}".lower()
+        for key, keywords in _SIGNAL_KEYWORDS.items():
+            if any(word in text for word in keywords):
+                signals[key]['results'].append(result)
+    return signals
+
+async def _gather_signals(domain, fullenrich_key, tavily_key):
+    """Fire the FullEnrich enrichment and the combined Tavily search concurrently"""
+    combined_query = f"{domain} recent funding round, sales hiring, tech stack"
+
+    async with httpx.AsyncClient(timeout=30) as session:
+        return await asyncio.gather(
+            _fullenrich_enrich(domain, fullenrich_key),
+            _tavily_search(combined_query, tavily_key, session),
+            return_exceptions=True
+        )
+
+def gather_signals(domain, fullenrich_key, tavily_key):
+    """Fetch company data and market signals in one concurrent batch
+
+    Returns (company_data, market_signals, errors). Errors come back as
+    (level, message) pairs for the caller to display: this function runs
+    under st.cache_data, and cached functions should not emit UI elements
+    that would be captured into (or confuse) the cache entry. Level 'error'
+    marks transport failures worth retrying (exceptions, transient
+    statuses); 'warning' marks definitive no-data outcomes such as a 404.
+    """
+    company, search = asyncio.run(
+        _gather_signals(domain, fullenrich_key, tavily_key)
+    )
+
+    errors = []
+
+    company_data = None
+    if isinstance(company, Exception):
+        errors.append(('error', f"FullEnrich Error: {str(company)}"))
+    elif company.status_code == 200:
+        company_data = company.json()
+    elif company.status_code in _TRANSIENT_STATUSES:
+        errors.append(('error', f"FullEnrich API returned status {company.status_code}"))
+    else:
+        errors.append(('warning', f"FullEnrich API returned status {company.status_code}"))
+
+    market_signals = None
+    if isinstance(search, Exception):
+        errors.append(('error', f"Tavily Error: {str(search)}"))
+    else:
+        market_signals = _bucket_signals(search)
+
+    return company_data, market_signals, errors
+
+# Fast/cheap model for mechanical passes; large model when quality matters
+FAST_MODEL = "llama-3.1-8b-instant"
+QUALITY_MODEL = "llama-3.3-70b-versatile"
+
+# Static system prompts. Kept byte-identical across calls, with the volatile
+# company-specific data appended last in the user message, so Groq's prompt
+# prefix cache can reuse the instruction tokens between analyses.
+EXTRACTION_SYSTEM_PROMPT = """You are a data extraction specialist. Analyze the market signals provided by the user, extract ONLY factual data points, and report them by calling submit_extraction."""
+
+# Output schema for the extraction step, declared as a forced tool call
+# instead of pasted into the prompt - the schema text is not billed as
+# prompt tokens and the arguments come back as guaranteed-parseable JSON
+EXTRACTION_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "submit_extraction",
+        "description": "Report the factual data points extracted from the market signals",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "funding": {
+                    "type": "object",
+                    "properties": {
+                        "last_round_date": {"type": ["string", "null"]},
+                        "amount": {"type": ["string", "null"]},
+                        "recency_months": {"type": ["number", "null"]}
+                    },
+                    "required": ["last_round_date", "amount", "recency_months"]
+                },
+                "hiring": {
+                    "type": "object",
+                    "properties": {
+                        "active_roles": {"type": "number"},
+                        "sales_focused": {"type": "boolean"},
+                        "growth_signal": {"type": "string", "enum": ["expanding", "stable", "contracting"]}
+                    },
+                    "required": ["active_roles", "sales_focused", "growth_signal"]
+                },
+                "tech_stack": {
+                    "type": "object",
+                    "properties": {
+                        "modern_tools": {"type": "array", "items": {"type": "string"}},
+                        "legacy_systems": {"type": "array", "items": {"type": "string"}},
+                        "recent_changes": {"type": "boolean"}
+                    },
+                    "required": ["modern_tools", "legacy_systems", "recent_changes"]
+                }
+            },
+            "required": ["funding", "hiring", "tech_stack"]
+        }
+    }
+}
+
+# What extraction would return given no signals - used to skip the call
+# entirely when the signal buckets are empty
+EMPTY_EXTRACTION = {
+    "funding": {"last_round_date": None, "amount": None, "recency_months": None},
+    "hiring": {"active_roles": 0, "sales_focused": False, "growth_signal": "stable"},
+    "tech_stack": {"modern_tools": [], "legacy_systems": [], "recent_changes": False}
+}
+
+SCORING_SYSTEM_PROMPT = """You are a sales intelligence engine. First calculate scores across 5 dimensions for the company described by the user, then provide strategic recommendations based on those scores, and report everything by calling submit_scores.
 
 Calculate scores (0-100) for each dimension using this logic:
 
@@ -251,85 +392,430 @@ Calculate scores (0-100) for each dimension using this logic:
    - Stable revenue: 50
    - No signals: 30
 
-Return ONLY this JSON:
-{{
-    "scores": {{
-        "timing": <0-100>,
-        "growth": <0-100>,
-        "tech_modernization": <0-100>,
-        "company_size": <0-100>,
-        "budget_availability": <0-100>
-    }},
-    "weights": {{
-        "timing": 0.30,
-        "growth": 0.25,
-        "tech_modernization": 0.20,
-        "company_size": 0.15,
-        "budget_availability": 0.10
-    }},
-    "weighted_score": <calculated weighted average>,
-    "confidence": "<high|medium|low>"
-}}"""
-
-        scoring_response = client.chat.completions.create(
-            messages=[
-                {"role": "system", "content": "You are a scoring algorithm. Return only valid JSON."},
-                {"role": "user", "content": scoring_prompt}
-            ],
-            model="llama-3.3-70b-versatile",
-            temperature=0.1,
-            max_tokens=800
-        )
-        
-        scores = json.loads(scoring_response.choices[0].message.content.strip())
-        
-        # Step 3: Generate strategic insights with chain-of-thought
-        insight_prompt = f"""You are a senior sales strategist. Given these scores, provide strategic recommendations.
-
-SCORES:
-{json.dumps(scores, indent=2)}
-
-COMPANY: {domain}
-DATA: {json.dumps(company_data, indent=2)[:500]}
-
-Use chain-of-thought reasoning:
+Then, for the insights, use chain-of-thought reasoning:
 1. Analyze the strongest signals
 2. Identify the primary budget trigger
 3. Determine the best approach angle
-4. Craft a value proposition
+4. Craft a value proposition"""
 
-Return ONLY this JSON:
-{{
+SCORING_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "submit_scores",
+        "description": "Report the dimension scores and strategic insights for the company",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "scores": {
+                    "type": "object",
+                    "properties": {
+                        "timing": {"type": "number"},
+                        "growth": {"type": "number"},
+                        "tech_modernization": {"type": "number"},
+                        "company_size": {"type": "number"},
+                        "budget_availability": {"type": "number"}
+                    },
+                    "required": ["timing", "growth", "tech_modernization", "company_size", "budget_availability"]
+                },
+                "confidence": {"type": "string", "enum": ["high", "medium", "low"]},
+                "insights": {
+                    "type": "object",
+                    "properties": {
+                        "reasoning": {"type": "string", "description": "2-3 sentence chain-of-thought explanation"},
+                        "primary_trigger": {"type": "string", "enum": ["funding", "hiring", "tech_debt", "expansion"]},
+                        "approach_angle": {"type": "string", "description": "Specific recommendation"},
+                        "evidence": {"type": "array", "items": {"type": "string"}, "description": "3 specific facts"},
+                        "recommendation": {"type": "string", "description": "Concrete next step"},
+                        "email_draft": {"type": "string", "description": "Personalized 100-word email using the insights"}
+                    },
+                    "required": ["reasoning", "primary_trigger", "approach_angle", "evidence", "recommendation", "email_draft"]
+                }
+            },
+            "required": ["scores", "confidence", "insights"]
+        }
+    }
+}
+
+# Fixed dimension weights for the advanced score - the weighted average and
+# the GREEN/YELLOW/RED banding are plain arithmetic, done locally rather
+# than delegated to (and occasionally fumbled by) the model
+SCORE_WEIGHTS = {
+    'timing': 0.30,
+    'growth': 0.25,
+    'tech_modernization': 0.20,
+    'company_size': 0.15,
+    'budget_availability': 0.10
+}
+
+SIMPLE_SYSTEM_PROMPT = """You are a sales intelligence expert. Always respond with valid JSON only. Analyze the company data provided by the user and return ONLY a JSON object with this exact structure:
+
+{
+    "score": <number 0-100>,
     "status": "<GREEN|YELLOW|RED>",
-    "reasoning": "<2-3 sentence chain-of-thought explanation>",
-    "primary_trigger": "<funding|hiring|tech_debt|expansion>",
-    "approach_angle": "<specific recommendation>",
-    "evidence": ["<specific fact 1>", "<specific fact 2>", "<specific fact 3>"],
-    "recommendation": "<concrete next step>",
-    "email_draft": "<personalized 100-word email using the insights>"
-}}
-
-STATUS RULES:
-- GREEN: weighted_score >= 70
-- YELLOW: weighted_score 40-69
-- RED: weighted_score < 40"""
-
-        insight_response = client.chat.completions.create(
+    "reasoning": "<2-3 sentence explanation>",
+    "evidence": ["<bullet point 1>", "<bullet point 2>", "<bullet point 3>"],
+    "recommendation": "<action to take>",
+    "email_draft": "<personalized outreach email>"
+}
+
+SCORING LOGIC:
+- GREEN (70-100): Recent funding (<6 months) OR active hiring OR expansion signals
+- YELLOW (40-69): Stable company, potential tech renewal, moderate signals
+- RED (0-39): No recent activity, risk signals, or stagnant"""
+
+@st.cache_resource
+def groq_cache():
+    """On-disk exact-match cache for Groq completions"""
+    return diskcache.Cache(".groq_cache")
+
+def _tool_call_kwargs(tools):
+    """Request kwargs forcing the single declared tool to be called"""
+    return {
+        "tools": tools,
+        "tool_choice": {"type": "function", "function": {"name": tools[0]["function"]["name"]}}
+    }
+
+def cached_chat_completion(client, messages, model, temperature, max_tokens,
+                           response_format=None, tools=None):
+    """Groq chat completion with an exact-match disk cache, returning the text
+
+    Identical payloads (same model, messages, temperature) never hit the API
+    twice - Streamlit reruns liberally on refresh/back-button, and each rerun
+    would otherwise re-pay full 70B inference. Keyed by SHA-256 of the
+    payload; entries expire after a day.
+
+    If tools is given, the (single) tool is forced via tool_choice and the
+    returned text is the tool call's JSON arguments.
+    """
+    payload = {"model": model, "messages": messages, "temperature": temperature,
+               "max_tokens": max_tokens, "response_format": response_format, "tools": tools}
+    key = hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    cache = groq_cache()
+    content = cache.get(key)
+    if content is not None:
+        return content
+
+    extra = {"response_format": response_format} if response_format else {}
+    if tools:
+        extra.update(_tool_call_kwargs(tools))
+    response = client.chat.completions.create(
+        messages=messages,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        **extra
+    )
+    message = response.choices[0].message
+    content = message.tool_calls[0].function.arguments if tools else message.content
+    cache.set(key, content, expire=86400)
+    return content
+
+# FullEnrich fields the prompts actually reference; everything else in the
+# payload (social links, employee lists, nested arrays) is dropped
+_COMPANY_FIELDS = ('name', 'domain', 'revenue', 'employees', 'industry', 'founded',
+                   'funding', 'funding_total', 'country', 'hq', 'description')
+
+def trim_market_signals(market_signals):
+    """Reduce raw Tavily responses to the title + snippet pairs the model needs
+
+    Raw results carry raw_content/score/url fields that can run to tens of
+    KB; prompt length directly drives Groq prefill time and cost.
+    """
+    if not market_signals:
+        return market_signals
+    return {
+        key: [
+            {'title': result.get('title'), 'snippet': (result.get('content') or '')[:400]}
+            for result in value.get('results', [])
+        ]
+        for key, value in market_signals.items()
+    }
+
+def trim_company_data(company_data):
+    """Keep only the top-level FullEnrich fields the prompts reference"""
+    if not company_data:
+        return company_data
+    return {key: company_data.get(key) for key in _COMPANY_FIELDS}
+
+def featurize(company_data, market_signals):
+    """Reduce the enrichment payloads to the handful of features that drive scoring
+
+    Sending the model a ~200-token feature dict instead of raw payloads cuts
+    prefill cost roughly with the square of the prompt length.
+    """
+    company = trim_company_data(company_data) or {}
+    signals = trim_market_signals(market_signals) or {}
+
+    def bucket_text(intent):
+        return " ".join(
+            f"{result.get('title') or ''} {result.get('snippet') or ''}"
+            for result in signals.get(intent, [])
+        )
+
+    funding_text = bucket_text('funding')
+    months_since_funding = None
+    months_match = re.search(r'(\d{1,2})\s+months?\s+ago', funding_text, re.IGNORECASE)
+    if months_match:
+        months_since_funding = int(months_match.group(1))
+    else:
+        year_match = re.search(r'\b(20\d{2})\b', funding_text)
+        if year_match:
+            months_since_funding = max(0, (datetime.now().year - int(year_match.group(1))) * 12)
+
+    hiring_text = bucket_text('hiring').lower()
+
+    return {
+        'name': company.get('name'),
+        'industry': company.get('industry'),
+        'revenue': company.get('revenue'),
+        'employees': company.get('employees'),
+        'months_since_funding': months_since_funding,
+        'funding_mentions': len(signals.get('funding', [])),
+        'hiring_sales_roles': any(term in hiring_text for term in ('sales', 'account executive', 'sdr')),
+        'hiring_mentions': len(signals.get('hiring', [])),
+        'tech_stack': [result.get('title') for result in signals.get('tech_stack', [])][:5]
+    }
+
+# Minimum cosine similarity for a semantic cache hit
+SEMANTIC_CACHE_THRESHOLD = 0.95
+# Oldest entries are evicted past this size to bound the linear scan
+SEMANTIC_CACHE_MAX_ENTRIES = 256
+
+@st.cache_resource
+def embedder():
+    """Small local embedding model backing the semantic analysis cache"""
+    return SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+
+@st.cache_resource
+def semantic_cache():
+    """Process-lifetime semantic cache: parallel lists of context embeddings
+    and the analyses they produced, plus a hit counter"""
+    return {'vectors': [], 'analyses': [], 'hits': 0}
+
+def embed_context(context):
+    """Embed a normalized JSON dump of the analysis context"""
+    return embedder().encode(orjson.dumps(context, option=orjson.OPT_SORT_KEYS).decode(), normalize_embeddings=True)
+
+def semantic_cache_lookup(vector):
+    """Return the analysis cached for the nearest prior context, if similar enough
+
+    Near-duplicate contexts (small enrichment-data variations on the same
+    company) skip the LLM call entirely - the single most expensive step.
+    """
+    cache = semantic_cache()
+    if not cache['vectors']:
+        return None
+    similarities = np.dot(np.array(cache['vectors']), vector)
+    best = int(np.argmax(similarities))
+    if similarities[best] >= SEMANTIC_CACHE_THRESHOLD:
+        cache['hits'] += 1
+        return cache['analyses'][best]
+    return None
+
+def semantic_cache_store(vector, analysis):
+    """Record a fresh analysis under its context embedding, evicting FIFO"""
+    cache = semantic_cache()
+    cache['vectors'].append(vector)
+    cache['analyses'].append(analysis)
+    if len(cache['vectors']) > SEMANTIC_CACHE_MAX_ENTRIES:
+        del cache['vectors'][0]
+        del cache['analyses'][0]
+
+async def _cached_chat_completion_async(client, messages, model, temperature, max_tokens,
+                                        response_format=None, tools=None):
+    """Async counterpart of cached_chat_completion (no streaming path)
+
+    Shares the disk cache and key scheme with the sync version, so sync and
+    async callers reuse each other's completions.
+    """
+    payload = {"model": model, "messages": messages, "temperature": temperature,
+               "max_tokens": max_tokens, "response_format": response_format, "tools": tools}
+    key = hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    cache = groq_cache()
+    content = cache.get(key)
+    if content is not None:
+        return content
+
+    extra = {"response_format": response_format} if response_format else {}
+    if tools:
+        extra.update(_tool_call_kwargs(tools))
+    response = await client.chat.completions.create(
+        messages=messages,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        **extra
+    )
+    message = response.choices[0].message
+    content = message.tool_calls[0].function.arguments if tools else message.content
+    cache.set(key, content, expire=86400)
+    return content
+
+async def _summarize_signal(client, intent, results):
+    """Two-sentence summary of one signal bucket on the fast model"""
+    return await _cached_chat_completion_async(
+        client,
+        messages=[
+            {"role": "system", "content": "You summarize web search results for a sales analyst. Reply with at most 2 sentences of plain text."},
+            {"role": "user", "content": f"Summarize what these results say about {intent}:\n{orjson.dumps(results).decode()}"}
+        ],
+        model=FAST_MODEL,
+        temperature=0.1,
+        max_tokens=120
+    )
+
+async def summarize_signals(client, trimmed_signals):
+    """Summarize the three signal buckets concurrently with 8B calls
+
+    One huge prefill over raw results scales badly with context length;
+    three small parallel prefills plus a tiny downstream prompt do not.
+    """
+    intents = ('funding', 'hiring', 'tech_stack')
+    summaries = await asyncio.gather(
+        *(_summarize_signal(client, intent, trimmed_signals.get(intent, [])) for intent in intents)
+    )
+    return dict(zip(intents, summaries))
+
+async def _extract_signals(client, trimmed_signals):
+    """Step 1: summarize the signal buckets, then extract structured facts"""
+    # Pre-digest each signal bucket with cheap parallel 8B calls so the
+    # extraction step reads three short summaries instead of raw results
+    signal_summaries = await summarize_signals(client, trimmed_signals) if trimmed_signals else {}
+
+    extraction_text = await _cached_chat_completion_async(
+        client,
+        messages=[
+            {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+            {"role": "user", "content": f"MARKET SIGNALS:\n{orjson.dumps(signal_summaries).decode()}"}
+        ],
+        model=FAST_MODEL,
+        temperature=0.1,
+        max_tokens=1000,
+        tools=[EXTRACTION_TOOL]
+    )
+
+    return orjson.loads(extraction_text.strip())
+
+async def _summarize_company(client, trimmed_company):
+    """Short company digest for the insight step, on the fast model"""
+    if not trimmed_company:
+        return ""
+    return await _cached_chat_completion_async(
+        client,
+        messages=[
+            {"role": "system", "content": "You summarize company firmographics for a sales strategist. Reply with at most 2 sentences of plain text."},
+            {"role": "user", "content": f"Summarize this company:\n{orjson.dumps(trimmed_company).decode()}"}
+        ],
+        model=FAST_MODEL,
+        temperature=0.1,
+        max_tokens=120
+    )
+
+async def _prepare_advanced_inputs(api_key, trimmed_signals, trimmed_company):
+    """Run signal extraction and the company digest on one event loop
+
+    The two branches share no data, and extraction internally fans out the
+    bucket summaries - the event loop overlaps all the network waits without
+    thread-pool overhead. The AsyncGroq client is created per run because it
+    is bound to the loop asyncio.run creates, and closed before the loop is
+    torn down so its connection pool does not leak.
+    """
+    client = AsyncGroq(api_key=api_key)
+    try:
+        return await asyncio.gather(
+            _extract_signals(client, trimmed_signals),
+            _summarize_company(client, trimmed_company)
+        )
+    finally:
+        await client.close()
+
+async def _summarize_company_only(api_key, trimmed_company):
+    """Company digest with its own short-lived client, for the no-signals path"""
+    client = AsyncGroq(api_key=api_key)
+    try:
+        return await _summarize_company(client, trimmed_company)
+    finally:
+        await client.close()
+
+def analyze_with_groq_advanced(company_data, market_signals, api_key, domain):
+    """
+    ADVANCED: Multi-step reasoning with Groq (Llama 3.3)
+
+    This approach uses:
+    1. Structured data extraction
+    2. Multi-dimensional scoring
+    3. Chain-of-thought reasoning
+    4. Confidence intervals
+    """
+    try:
+        client = groq_client(api_key)
+
+        trimmed_signals = trim_market_signals(market_signals)
+        trimmed_company = trim_company_data(company_data)
+
+        # Empty signal buckets make the extraction output fully determined -
+        # skip the round trips and substitute the known result
+        if not trimmed_signals or not any(trimmed_signals.get(k) for k in ('funding', 'hiring', 'tech_stack')):
+            if not trimmed_company:
+                # Nothing to analyze at all: the verdict is a foregone RED
+                return {
+                    "score": 10,
+                    "status": "RED",
+                    "reasoning": f"No enrichment data or market signals were found for {domain}; there is no evidence of an open budget window.",
+                    "evidence": [],
+                    "recommendation": "Deprioritize until enrichment sources return data for this domain.",
+                    "email_draft": "",
+                    "detailed_scores": {dim: 10 for dim in SCORE_WEIGHTS},
+                    "confidence": "low",
+                    "primary_trigger": "No data available",
+                    "approach_angle": "Not recommended - no signals to act on"
+                }
+            extracted_data = EMPTY_EXTRACTION
+            company_digest = asyncio.run(
+                _summarize_company_only(api_key, trimmed_company)
+            )
+        else:
+            # Signal extraction and the company digest feed different later
+            # steps and share no data - run them concurrently so only scoring
+            # and insight remain on the critical path
+            extracted_data, company_digest = asyncio.run(
+                _prepare_advanced_inputs(api_key, trimmed_signals, trimmed_company)
+            )
+
+        # Steps 2+3 merged: one structured call emits both the dimension
+        # scores and the strategic insights, halving 70B round trips and
+        # prompt boilerplate
+        scoring_user_prompt = f"""COMPANY: {domain}
+COMPANY DATA:
+{orjson.dumps(trimmed_company).decode()}
+
+COMPANY DIGEST: {company_digest}
+
+EXTRACTED INSIGHTS:
+{orjson.dumps(extracted_data).decode()}"""
+
+        scoring_text = cached_chat_completion(
+            client,
             messages=[
-                {"role": "system", "content": "You are a strategic sales advisor. Use chain-of-thought reasoning."},
-                {"role": "user", "content": insight_prompt}
+                {"role": "system", "content": SCORING_SYSTEM_PROMPT},
+                {"role": "user", "content": scoring_user_prompt}
             ],
-            model="llama-3.3-70b-versatile",
-            temperature=0.4,
-            max_tokens=1200
+            model=QUALITY_MODEL,
+            temperature=0.2,
+            max_tokens=2000,
+            tools=[SCORING_TOOL]
         )
-        
-        insights = json.loads(insight_response.choices[0].message.content.strip())
-        
+
+        scores = orjson.loads(scoring_text.strip())
+        insights = scores['insights']
+
+        weighted_score = sum(scores['scores'][dim] * weight for dim, weight in SCORE_WEIGHTS.items())
+        status = "GREEN" if weighted_score >= 70 else "YELLOW" if weighted_score >= 40 else "RED"
+
         # Combine all results
         final_analysis = {
-            "score": round(scores['weighted_score']),
-            "status": insights['status'],
+            "score": round(weighted_score),
+            "status": status,
             "reasoning": insights['reasoning'],
             "evidence": insights['evidence'],
             "recommendation": insights['recommendation'],
@@ -349,58 +835,121 @@ STATUS RULES:
 def analyze_with_groq_simple(company_data, market_signals, api_key, domain):
     """SIMPLE: Single-pass analysis (original approach)"""
     try:
-        client = Groq(api_key=api_key)
+        client = groq_client(api_key)
         
         context = {
             "domain": domain,
-            "company_info": company_data,
-            "market_signals": market_signals
+            "features": featurize(company_data, market_signals)
         }
-        
-        prompt = f"""You are a sales intelligence AI. Analyze this company data and return ONLY a JSON object with this exact structure:
 
-{{
-    "score": <number 0-100>,
-    "status": "<GREEN|YELLOW|RED>",
-    "reasoning": "<2-3 sentence explanation>",
-    "evidence": ["<bullet point 1>", "<bullet point 2>", "<bullet point 3>"],
-    "recommendation": "<action to take>",
-    "email_draft": "<personalized outreach email>"
-}}
+        # Semantic cache: near-identical contexts reuse the prior analysis
+        context_vector = embed_context(context)
+        cached_analysis = semantic_cache_lookup(context_vector)
+        if cached_analysis is not None:
+            return cached_analysis
 
-SCORING LOGIC:
-- GREEN (70-100): Recent funding (<6 months) OR active hiring OR expansion signals
-- YELLOW (40-69): Stable company, potential tech renewal, moderate signals
-- RED (0-39): No recent activity, risk signals, or stagnant
-
-COMPANY DATA:
-{json.dumps(context, indent=2)}
+        messages = [
+            {"role": "system", "content": SIMPLE_SYSTEM_PROMPT},
+            {"role": "user", "content": f"COMPANY DATA:\n{orjson.dumps(context).decode()}"}
+        ]
 
-Return ONLY the JSON object, no other text."""
+        # First pass on the fast 8B model - the task is a fixed-schema JSON
+        # with a handful of short fields, well within its reach
+        try:
+            response_text = cached_chat_completion(
+                client,
+                messages=messages,
+                model=FAST_MODEL,
+                temperature=0.3,
+                max_tokens=700,
+                response_format={"type": "json_object"}
+            )
+            analysis = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            analysis = None
 
-        chat_completion = client.chat.completions.create(
-            messages=[
-                {"role": "system", "content": "You are a sales intelligence expert. Always respond with valid JSON only."},
-                {"role": "user", "content": prompt}
-            ],
-            model="llama-3.3-70b-versatile",
-            temperature=0.3,
-            max_tokens=2000
-        )
-        
-        response_text = chat_completion.choices[0].message.content
-        
-        start_idx = response_text.find('{')
-        end_idx = response_text.rfind('}') + 1
-        json_str = response_text[start_idx:end_idx]
-        
-        analysis = json.loads(json_str)
+        # Escalate to 70B when the fast pass fails to parse, returns a
+        # missing or non-numeric score (JSON mode guarantees valid JSON,
+        # not a numeric "score"), or lands too close to a GREEN/YELLOW/RED
+        # boundary to trust
+        score = analysis.get('score') if analysis else None
+        if analysis is None or not isinstance(score, (int, float)) or abs(score - 70) < 3 or abs(score - 40) < 3:
+            response_text = cached_chat_completion(
+                client,
+                messages=messages,
+                model=QUALITY_MODEL,
+                temperature=0.3,
+                max_tokens=2000,
+                response_format={"type": "json_object"}
+            )
+            analysis = orjson.loads(response_text)
+        semantic_cache_store(context_vector, analysis)
         return analysis
         
     except Exception as e:
         st.error(f"Groq Simple Analysis Error: {str(e)}")
         return None
 
+def _keys_digest(*keys):
+    """Stable digest of the API keys so cached entries invalidate on rotation
+    without the secrets themselves becoming part of the cache key."""
+    return hashlib.sha256("|".join(keys).encode()).hexdigest()
+
+class AnalysisFailed(Exception):
+    """Raised instead of returning a failed result from the cached pipeline
+
+    st.cache_data memoizes return values, failures included - a transient
+    API error returned normally would replay on every click for the full
+    TTL. Raising keeps failed runs out of the cache so the next click
+    retries; the errors gathered along the way ride on the exception for
+    the caller to display.
+    """
+    def __init__(self, errors):
+        super().__init__("analysis failed")
+        self.errors = errors
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_signals_cached(domain, keys_digest, _api_keys):
+    """Enrichment fetch memoized per (domain, keys), independent of analysis mode
+
+    Funding/hiring/tech results for a domain rarely change within an hour;
+    caching them separately means switching analysis modes (or any cache miss
+    on the LLM side) skips the network round trips entirely. Raises
+    AnalysisFailed when any source failed at the transport level, so
+    transient blips are retried rather than memoized; definitive no-data
+    outcomes (warnings) are safe to cache.
+    """
+    company_data, market_signals, errors = gather_signals(domain, _api_keys['fullenrich'], _api_keys['tavily'])
+    if any(level == 'error' for level, _ in errors):
+        raise AnalysisFailed(errors)
+    if not company_data and not market_signals:
+        raise AnalysisFailed(errors)
+    return company_data, market_signals, errors
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def run_analysis(domain, mode, keys_digest, _api_keys):
+    """Full enrichment + analysis pipeline, memoized per (domain, mode, keys)
+
+    Repeat analyses of the same domain within an hour return instantly
+    instead of re-paying 4 network round trips plus LLM inference.
+    """
+    with st.spinner("🔍 Gathering company data and market signals..."):
+        company_data, market_signals, errors = fetch_signals_cached(domain, keys_digest, _api_keys)
+
+    if mode == 'advanced':
+        with st.spinner("🧠 Running advanced multi-step analysis with Groq AI..."):
+            analysis = analyze_with_groq_advanced(company_data, market_signals, _api_keys['groq'], domain)
+    else:
+        with st.spinner("🧠 Analyzing with Groq AI (Simple Mode)..."):
+            analysis = analyze_with_groq_simple(company_data, market_signals, _api_keys['groq'], domain)
+
+    # The analyze functions surface their own error and return None;
+    # propagate rather than cache the failure
+    if analysis is None:
+        raise AnalysisFailed(errors)
+
+    return company_data, market_signals, analysis, errors
+
 # Analysis mode selection
 analysis_mode = st.radio(
     "🧠 Analysis Mode",
@@ -426,127 +975,147 @@ if st.button("🚀 Analyze Budget Window", type="primary", use_container_width=T
     elif not domain:
         st.warning("⚠️ Please enter a domain to analyze.")
     else:
-        with st.spinner("🔍 Enriching company data..."):
-            company_data = get_fullenrich_data(domain, fullenrich_key)
-        
-        with st.spinner("📡 Gathering market signals..."):
-            market_signals = get_market_signals(domain, tavily_key)
-        
-        if company_data or market_signals:
-            if "Advanced" in analysis_mode:
-                with st.spinner("🧠 Running advanced multi-step analysis with Groq AI..."):
-                    analysis = analyze_with_groq_advanced(company_data, market_signals, groq_key, domain)
-            else:
-                with st.spinner("🧠 Analyzing with Groq AI (Simple Mode)..."):
-                    analysis = analyze_with_groq_simple(company_data, market_signals, groq_key, domain)
-            
-            if analysis:
-                st.success("✅ Analysis Complete!")
-                
-                # Display Score Card
-                score = analysis.get('score', 0)
-                status = analysis.get('status', 'YELLOW')
-                
-                status_class = {
-                    'GREEN': 'score-green',
-                    'YELLOW': 'score-yellow',
-                    'RED': 'score-red'
-                }.get(status, 'score-yellow')
-                
-                col1, col2, col3 = st.columns([2, 1, 1])
-                
-                with col1:
-                    confidence_badge = ""
-                    if 'confidence' in analysis:
-                        confidence_badge = f"<p style='margin-top:0.5rem;'>Confidence: {analysis['confidence'].upper()}</p>"
-                    
-                    st.markdown(f"""
-                    <div class="score-card {status_class}">
-                        <h2 style="margin:0;">Budget Window Score</h2>
-                        <h1 style="font-size:4rem;margin:0.5rem 0;">{score}</h1>
-                        <h3 style="margin:0;">Status: {status}</h3>
-                        {confidence_badge}
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    if company_data:
-                        revenue = company_data.get('revenue', 'N/A')
-                        st.markdown(f"""
-                        <div class="metric-card">
-                            <h4>💰 Revenue</h4>
-                            <h2>{revenue}</h2>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                with col3:
-                    if company_data:
-                        employees = company_data.get('employees', 'N/A')
-                        st.markdown(f"""
-                        <div class="metric-card">
-                            <h4>👥 Employees</h4>
-                            <h2>{employees}</h2>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                st.divider()
-                
-                # Advanced mode: Show detailed scores
-                if "Advanced" in analysis_mode and 'detailed_scores' in analysis:
-                    st.subheader("📊 Multi-Dimensional Scores")
-                    score_cols = st.columns(5)
-                    score_names = ['Timing', 'Growth', 'Tech Mod', 'Size', 'Budget']
-                    score_keys = ['timing', 'growth', 'tech_modernization', 'company_size', 'budget_availability']
-                    
-                    for idx, (col, name, key) in enumerate(zip(score_cols, score_names, score_keys)):
-                        with col:
-                            score_val = analysis['detailed_scores'].get(key, 0)
-                            st.metric(name, f"{score_val}/100")
-                    
-                    if 'primary_trigger' in analysis:
-                        st.info(f"**Primary Trigger:** {analysis['primary_trigger'].replace('_', ' ').title()}")
-                    if 'approach_angle' in analysis:
-                        st.success(f"**Recommended Approach:** {analysis['approach_angle']}")
-                    
-                    st.divider()
-                
-                # Reasoning
-                st.subheader("🎯 AI Reasoning")
-                st.info(analysis.get('reasoning', 'No reasoning provided.'))
-                
-                # Evidence
-                st.subheader("📊 Key Evidence")
-                evidence_items = analysis.get('evidence', [])
-                for item in evidence_items:
-                    st.markdown(f"<span class='evidence-tag'>✓ {item}</span>", unsafe_allow_html=True)
-                
-                st.divider()
-                
-                # Recommendation
-                st.subheader("💡 Recommended Action")
-                st.success(analysis.get('recommendation', 'No recommendation provided.'))
-                
-                # Email Draft
-                st.subheader("✉️ AI-Generated Outreach Email")
-                email_draft = analysis.get('email_draft', 'No email draft available.')
-                st.code(email_draft, language=None)
-                
-                st.divider()
-                
-                # Raw Data (Expandable)
-                with st.expander("🔍 View Raw Data (FullEnrich)"):
-                    if company_data:
-                        st.json(company_data)
-                    else:
-                        st.info("No data available from FullEnrich.")
-                
-                with st.expander("🔍 View Raw Data (Tavily Market Signals)"):
-                    if market_signals:
-                        st.json(market_signals)
-                    else:
-                        st.info("No data available from Tavily.")
+        # A domain that doesn't resolve can't yield meaningful signals -
+        # fail fast instead of paying for Tavily + Groq on a dead lookup
+        try:
+            socket.gethostbyname(domain)
+        except socket.gaierror:
+            st.error(f"❌ Domain not reachable: {domain}")
+            st.stop()
+
+        mode = 'advanced' if "Advanced" in analysis_mode else 'simple'
+
+        # A stored result for this exact (domain, mode) needs no pipeline
+        # work at all - not even cache lookups
+        last = st.session_state.get('last_result')
+        if last and (last['domain'], last['mode']) == (domain, mode):
+            company_data, market_signals, analysis = last['company'], last['signals'], last['analysis']
         else:
-            st.error("❌ Failed to gather data. Please check your API keys and try again.")
+            api_keys = {'groq': groq_key, 'tavily': tavily_key, 'fullenrich': fullenrich_key}
+            try:
+                company_data, market_signals, analysis, errors = run_analysis(
+                    domain, mode, _keys_digest(groq_key, tavily_key, fullenrich_key), api_keys
+                )
+            except AnalysisFailed as failed:
+                for level, message in failed.errors:
+                    getattr(st, level)(message)
+                st.error("❌ Analysis failed. Please check your API keys and try again.")
+                st.stop()
+            for level, message in errors:
+                getattr(st, level)(message)
+
+        # Persist so expander clicks / widget tweaks rerun the script
+        # without re-entering the pipeline
+        st.session_state['last_result'] = {
+            'domain': domain,
+            'mode': mode,
+            'company': company_data,
+            'signals': market_signals,
+            'analysis': analysis
+        }
+
+def render_analysis(company_data, market_signals, analysis, mode):
+    """Render a completed analysis (fresh or replayed from session state)"""
+    st.success("✅ Analysis Complete!")
+
+    # Display Score Card
+    score = analysis.get('score', 0)
+    status = analysis.get('status', 'YELLOW')
+
+    status_class = _STATUS_CLASS.get(status, 'score-yellow')
+
+    col1, col2, col3 = st.columns([2, 1, 1])
+
+    with col1:
+        confidence_badge = ""
+        if 'confidence' in analysis:
+            confidence_badge = f"<p style='margin-top:0.5rem;'>Confidence: {analysis['confidence'].upper()}</p>"
+
+        st.markdown(
+            SCORE_CARD_TMPL.format(cls=status_class, score=score, status=status, confidence=confidence_badge),
+            unsafe_allow_html=True
+        )
+
+    with col2:
+        if company_data:
+            revenue = company_data.get('revenue', 'N/A')
+            st.markdown(METRIC_CARD_TMPL.format(label="💰 Revenue", value=revenue), unsafe_allow_html=True)
+
+    with col3:
+        if company_data:
+            employees = company_data.get('employees', 'N/A')
+            st.markdown(METRIC_CARD_TMPL.format(label="👥 Employees", value=employees), unsafe_allow_html=True)
+
+    st.divider()
+
+    # Advanced mode: Show detailed scores
+    if mode == 'advanced' and 'detailed_scores' in analysis:
+        st.subheader("📊 Multi-Dimensional Scores")
+        score_cols = st.columns(5)
+        score_names = ['Timing', 'Growth', 'Tech Mod', 'Size', 'Budget']
+        score_keys = ['timing', 'growth', 'tech_modernization', 'company_size', 'budget_availability']
+
+        for idx, (col, name, key) in enumerate(zip(score_cols, score_names, score_keys)):
+            with col:
+                score_val = analysis['detailed_scores'].get(key, 0)
+                st.metric(name, f"{score_val}/100")
+
+        if 'primary_trigger' in analysis:
+            st.info(f"**Primary Trigger:** {analysis['primary_trigger'].replace('_', ' ').title()}")
+        if 'approach_angle' in analysis:
+            st.success(f"**Recommended Approach:** {analysis['approach_angle']}")
+
+        st.divider()
+
+    # Reasoning
+    st.subheader("🎯 AI Reasoning")
+    st.info(analysis.get('reasoning', 'No reasoning provided.'))
+
+    # Evidence
+    st.subheader("📊 Key Evidence")
+    evidence_items = analysis.get('evidence', [])
+    for item in evidence_items:
+        st.markdown(f"<span class='evidence-tag'>✓ {item}</span>", unsafe_allow_html=True)
+
+    st.divider()
+
+    # Recommendation
+    st.subheader("💡 Recommended Action")
+    st.success(analysis.get('recommendation', 'No recommendation provided.'))
+
+    # Email Draft
+    st.subheader("✉️ AI-Generated Outreach Email")
+    email_draft = analysis.get('email_draft', 'No email draft available.')
+    st.code(email_draft, language=None)
+
+    st.divider()
+
+    # Raw Data (Expandable)
+    with st.expander("🔍 View Raw Data (FullEnrich)"):
+        if company_data:
+            st.json(company_data)
+        else:
+            st.info("No data available from FullEnrich.")
+
+    with st.expander("🔍 View Raw Data (Tavily Market Signals)"):
+        if market_signals:
+            st.json(market_signals)
+        else:
+            st.info("No data available from Tavily.")
+
+# Render the last completed analysis for the domain currently in the input,
+# whether it was just computed or replayed across a rerun
+last_result = st.session_state.get('last_result')
+_current_mode = 'advanced' if "Advanced" in analysis_mode else 'simple'
+if last_result and (last_result['domain'], last_result['mode']) == (domain, _current_mode):
+    render_analysis(last_result['company'], last_result['signals'], last_result['analysis'], last_result['mode'])
+    if st.button("🔄 Re-analyze (clear cached result)"):
+        # The session-state copy is only the top layer - the st.cache_data
+        # entries below it would re-serve the identical result for the TTL
+        run_analysis.clear()
+        fetch_signals_cached.clear()
+        del st.session_state['last_result']
+        st.rerun()
 
 # Footer
 st.divider()